@@ -10,12 +10,18 @@ from __future__ import annotations
 import argparse
 import re
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
 
 HEADING_RE = re.compile(r"^##\s+(?P<title>.+?)\s*$")
-BRACKETED_VERSION_RE = re.compile(r"^\[(?P<label>[^\]]+)\](?:\s+-\s+.*)?$")
+# Either ``[label]`` optionally followed by `` - date``, or everything before the first
+# `` - `` separator (or the whole title when there is none).
+LABEL_RE = re.compile(
+    r"^\s*(?:\[(?P<bracketed>[^\]]+)\](?:\s+-\s+.*)?|(?P<bare>.*?)(?: - .*)?)\s*$",
+    re.DOTALL,
+)
 
 
 @dataclass(slots=True)
@@ -27,27 +33,23 @@ class ChangelogSection:
     content: str
 
 
-def parse_sections(markdown: str) -> list[ChangelogSection]:
-    """Return level-2 changelog sections from markdown text."""
+def iter_sections(lines: Iterable[str]) -> Iterator[ChangelogSection]:
+    """Yield level-2 changelog sections from markdown lines as each one completes.
+
+    ``lines`` may keep their line endings (as when iterating an open file); only the lines
+    of the section currently being read are buffered.
+    """
 
-    lines = markdown.splitlines()
-    sections: list[ChangelogSection] = []
     current_heading: str | None = None
     current_title: str | None = None
     current_lines: list[str] = []
 
-    for line in lines:
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
         match = HEADING_RE.match(line)
         if match:
             if current_heading is not None and current_title is not None:
-                sections.append(
-                    ChangelogSection(
-                        heading=current_heading,
-                        label=_extract_label(current_title),
-                        content="\n".join([current_heading, *current_lines]).rstrip()
-                        + "\n",
-                    )
-                )
+                yield _build_section(current_heading, current_title, current_lines)
             current_heading = line
             current_title = match.group("title")
             current_lines = []
@@ -56,27 +58,34 @@ def parse_sections(markdown: str) -> list[ChangelogSection]:
             current_lines.append(line)
 
     if current_heading is not None and current_title is not None:
-        sections.append(
-            ChangelogSection(
-                heading=current_heading,
-                label=_extract_label(current_title),
-                content="\n".join([current_heading, *current_lines]).rstrip() + "\n",
-            )
-        )
+        yield _build_section(current_heading, current_title, current_lines)
+
+
+def parse_sections(markdown: str) -> list[ChangelogSection]:
+    """Return level-2 changelog sections from markdown text."""
+
+    return list(iter_sections(markdown.splitlines()))
 
-    return sections
+
+def _build_section(heading: str, title: str, lines: list[str]) -> ChangelogSection:
+    """Assemble one section from its heading line and body lines."""
+
+    return ChangelogSection(
+        heading=heading,
+        label=_extract_label(title),
+        content="\n".join([heading, *lines]).rstrip() + "\n",
+    )
 
 
 def _extract_label(title: str) -> str:
     """Extract the logical section label from a changelog heading title."""
 
-    stripped = title.strip()
-    bracketed = BRACKETED_VERSION_RE.match(stripped)
-    if bracketed:
-        return bracketed.group("label").strip()
-    if " - " in stripped:
-        return stripped.split(" - ", 1)[0].strip()
-    return stripped
+    match = LABEL_RE.match(title)
+    assert match is not None
+    label = match.group("bracketed")
+    if label is None:
+        label = match.group("bare")
+    return label.strip()
 
 
 def normalize_version_label(value: str) -> str:
@@ -89,25 +98,25 @@ def normalize_version_label(value: str) -> str:
 
 
 def select_section(
-    sections: list[ChangelogSection], *, target_tag: str | None = None
+    sections: Iterable[ChangelogSection], *, target_tag: str | None = None
 ) -> ChangelogSection:
-    """Choose the newest released section or a specific tag section."""
-
-    released = [
-        section
-        for section in sections
-        if normalize_version_label(section.label) != "unreleased"
-    ]
-    if not released:
-        raise ValueError("No released changelog entries were found.")
+    """Choose the newest released section or a specific tag section.
 
-    if target_tag is None:
-        return released[0]
+    ``sections`` is consumed lazily, so iteration stops at the first matching section.
+    """
 
-    target = normalize_version_label(target_tag)
-    for section in released:
-        if normalize_version_label(section.label) == target:
+    target = None if target_tag is None else normalize_version_label(target_tag)
+    found_released = False
+    for section in sections:
+        label = normalize_version_label(section.label)
+        if label == "unreleased":
+            continue
+        found_released = True
+        if target is None or label == target:
             return section
+
+    if not found_released:
+        raise ValueError("No released changelog entries were found.")
     raise ValueError(f"Could not find changelog entry for tag/version: {target_tag}")
 
 
@@ -135,12 +144,12 @@ def main() -> int:
         print(f"Changelog file not found: {changelog_path}", file=sys.stderr)
         return 2
 
-    sections = parse_sections(changelog_path.read_text(encoding="utf-8"))
-    try:
-        section = select_section(sections, target_tag=args.tag)
-    except ValueError as exc:
-        print(str(exc), file=sys.stderr)
-        return 2
+    with changelog_path.open(encoding="utf-8") as changelog:
+        try:
+            section = select_section(iter_sections(changelog), target_tag=args.tag)
+        except ValueError as exc:
+            print(str(exc), file=sys.stderr)
+            return 2
 
     if args.output:
         Path(args.output).write_text(section.content, encoding="utf-8")
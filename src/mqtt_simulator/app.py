@@ -24,6 +24,7 @@ from .runtime.models import (
 )
 from .sim import build_payload_builder
 from .sim.payloads import build_payload_builder as build_inline_payload_builder
+from .sim.seeding import derive_seed
 
 
 @dataclass(slots=True)
@@ -134,6 +135,5 @@ def prepare_simulation(
 def _payload_rng(seed: int | None, unique_id: str) -> random.Random:
     """Return a deterministic payload RNG when a base seed is configured."""
 
-    if seed is None:
-        return random.Random()
-    return random.Random(hash((seed, unique_id)) & 0xFFFFFFFFFFFF)
+    rng_seed = derive_seed(seed, unique_id)
+    return random.Random(rng_seed) if rng_seed is not None else random.Random()
@@ -2,21 +2,19 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import sys
 from pathlib import Path
 
 import typer
 
-from .app import prepare_simulation, validate_config_file
 from .cli_errors import handle_cli_exception
 from .logging_config import configure_logging, shutdown_logging
-from .mqtt.paho_adapter import PahoBrokerAdapter
-from .render import LogRenderer, OutputMode, TableRenderer, resolve_output_mode
-from .runtime.engine import SimulationEngine
 from .version import get_version
 
+# Config models (pydantic), paho and the Rich renderers are imported inside the
+# commands that use them so ``version`` and ``--help`` start quickly.
+
 app = typer.Typer(help="MQTT Simulator", add_completion=False)
 
 
@@ -43,6 +41,9 @@ def validate(
 ) -> None:
     """Validate a config file and print a compact summary."""
 
+    from .app import validate_config_file
+    from .render import OutputMode
+
     logging_ctx = configure_logging(verbose=verbose, output_mode=OutputMode.LOG.value)
     logger = logging_ctx.logger.getChild("cli.validate")
     try:
@@ -89,6 +90,13 @@ def run(
 ) -> None:
     """Run the simulator and render a table (TTY) or log output (non-TTY)."""
 
+    import asyncio
+
+    from .app import prepare_simulation
+    from .mqtt.paho_adapter import PahoBrokerAdapter
+    from .render import LogRenderer, OutputMode, TableRenderer, resolve_output_mode
+    from .runtime.engine import SimulationEngine
+
     logger = logging.getLogger("mqtt_simulator.cli.run")
     logging_ctx = None
     try:
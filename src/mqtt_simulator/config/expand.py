@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from itertools import product
 from typing import Any
 
+from pydantic import ValidationError
+
 from ..errors import ConfigValidationError
 from .duration import format_duration
 from .models import (
@@ -16,6 +18,7 @@ from .models import (
     PayloadConfig,
     SimulatorConfig,
     StreamConfig,
+    format_validation_error,
 )
 
 _TEMPLATE_RE = re.compile(r"\$\{(?P<name>[A-Za-z_][A-Za-z0-9_]*)\}")
@@ -80,12 +83,19 @@ def resolve_simulation(config: SimulatorConfig) -> ResolvedSimulationConfig:
     resolved_clients: dict[str, ResolvedClientConfig] = {}
     stream_items: list[ResolvedStreamConfig] = []
     session_by_signature: dict[str, str] = {}
+    # Dump each template once; expansion contexts only template over these dicts.
+    client_data_by_name = {
+        name: client.model_dump(mode="python") for name, client in config.clients.items()
+    }
 
     for stream_index, stream in enumerate(config.streams):
         client_template = config.clients[stream.client]
+        client_data = client_data_by_name[stream.client]
+        payload_data = stream.payload.model_dump(mode="python", by_alias=True)
         for offset, context in enumerate(_iter_contexts(stream)):
             resolved_client = _resolve_client_session(
                 client_template,
+                client_data=client_data,
                 context=context,
                 session_by_signature=session_by_signature,
                 resolved_clients=resolved_clients,
@@ -97,6 +107,7 @@ def resolve_simulation(config: SimulatorConfig) -> ResolvedSimulationConfig:
             )
             payload = _resolve_payload(
                 stream.payload,
+                payload_data=payload_data,
                 context=context,
                 path=f"streams[{stream_index}].payload",
             )
@@ -135,16 +146,17 @@ def resolve_streams(config: SimulatorConfig) -> list[ResolvedStreamConfig]:
 def _resolve_client_session(
     client: ClientConfig,
     *,
+    client_data: dict[str, Any],
     context: dict[str, Any],
     session_by_signature: dict[str, str],
     resolved_clients: dict[str, ResolvedClientConfig],
 ) -> ResolvedClientConfig:
     """Resolve one client session from a stream context."""
 
-    resolved_client = _resolve_client_model(client, context=context)
-    signature = json.dumps(
-        resolved_client.model_dump(mode="python"), sort_keys=True, default=str
+    resolved_client, resolved_data = _resolve_client_model(
+        client, client_data=client_data, context=context
     )
+    signature = json.dumps(resolved_data, sort_keys=True, default=str)
     existing = session_by_signature.get(signature)
     if existing is not None:
         return resolved_clients[existing]
@@ -177,13 +189,19 @@ def _resolve_client_session(
 
 
 def _resolve_client_model(
-    client: ClientConfig, *, context: dict[str, Any]
-) -> ClientConfig:
-    """Resolve client templates against one stream context."""
+    client: ClientConfig, *, client_data: dict[str, Any], context: dict[str, Any]
+) -> tuple[ClientConfig, dict[str, Any]]:
+    """Resolve client templates against one stream context.
+
+    Returns the resolved model together with its ``model_dump`` data.
+    """
 
-    data = client.model_dump(mode="python")
-    templated = _apply_templates(data, context=context, path=f"clients.{client.name}")
-    return ClientConfig.model_validate(templated)
+    templated = _apply_templates(client_data, context=context, path=f"clients.{client.name}")
+    if templated == client_data:
+        # Nothing was substituted, so the already-validated model can be reused as-is.
+        return client, client_data
+    resolved = ClientConfig.model_validate(templated)
+    return resolved, resolved.model_dump(mode="python")
 
 
 def _resolve_lifecycle_message(
@@ -211,12 +229,28 @@ def _resolve_payload(
     *,
     context: dict[str, Any],
     path: str,
+    payload_data: dict[str, Any] | None = None,
 ) -> PayloadConfig:
-    """Apply template substitution to a payload config."""
-
-    payload_dict = payload.model_dump(mode="python")
-    templated = _apply_templates(payload_dict, context=context, path=path)
-    return PayloadConfig.model_validate(templated)
+    """Apply template substitution to a payload config.
+
+    ``payload_data`` may carry an already dumped copy of ``payload`` so callers
+    expanding one template many times only dump it once.
+    """
+
+    if payload_data is None:
+        payload_data = payload.model_dump(mode="python", by_alias=True)
+    templated = _apply_templates(payload_data, context=context, path=path)
+    if templated == payload_data:
+        return payload
+    try:
+        return PayloadConfig.model_validate(templated)
+    except ValidationError as exc:
+        # Checks that depend on expanded values (such as expr syntax) only run here.
+        errors = [format_validation_error(item, root=path) for item in exc.errors()]
+        message = "Config validation failed."
+        if errors:
+            message = f"{message} {errors[0]}"
+        raise ConfigValidationError(message, errors=errors) from exc
 
 
 def _iter_contexts(stream: StreamConfig) -> list[dict[str, Any]]:
@@ -279,6 +313,10 @@ def _apply_templates(value: Any, *, context: dict[str, Any], path: str) -> Any:
 def _apply_string_template(value: str, *, context: dict[str, Any], path: str) -> str:
     """Expand ``${name}`` placeholders in one string."""
 
+    if "${" not in value:
+        # Most strings in a config are literals; skip the regex and closure for them.
+        return value
+
     def replace(match: re.Match[str]) -> str:
         name = match.group("name")
         if name not in context:
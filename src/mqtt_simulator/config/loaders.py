@@ -9,7 +9,7 @@ from pydantic import ValidationError
 
 from ..errors import ConfigLoadError, ConfigValidationError
 from .expand import resolve_simulation
-from .models import ConfigSummary, SimulatorConfig
+from .models import ConfigSummary, SimulatorConfig, format_validation_error
 
 
 def load_config(path: Path) -> SimulatorConfig:
@@ -32,7 +32,7 @@ def load_config(path: Path) -> SimulatorConfig:
     try:
         return SimulatorConfig.model_validate(payload)
     except ValidationError as exc:
-        errors = [_format_validation_error(item) for item in exc.errors()]
+        errors = [format_validation_error(item) for item in exc.errors()]
         message = "Config validation failed."
         if errors:
             message = f"{message} {errors[0]}"
@@ -67,21 +67,3 @@ def format_summary(summary: ConfigSummary) -> str:
         f"resolved_streams={summary.resolved_stream_count} "
         f"payload_kinds=[{payloads}]"
     )
-
-
-def _format_validation_error(item: dict[str, object]) -> str:
-    """Format one pydantic error into a short, readable message."""
-
-    loc = item.get("loc") or ()
-    parts: list[str] = []
-    for value in loc if isinstance(loc, tuple) else (loc,):
-        if isinstance(value, int):
-            if not parts:
-                parts.append(f"[{value}]")
-            else:
-                parts[-1] = f"{parts[-1]}[{value}]"
-        else:
-            parts.append(str(value))
-    field_path = ".".join(parts) if parts else "<root>"
-    message = str(item.get("msg", "validation error"))
-    return f"{field_path}: {message}"
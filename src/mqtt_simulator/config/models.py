@@ -22,6 +22,38 @@ _GENERATOR_KEYS = {
     "null",
 }
 
+# Payload kind -> PayloadConfig attribute, in the order kinds are documented.
+_PAYLOAD_FIELDS: dict[str, str] = {
+    "text": "text_payload",
+    "json": "json_payload",
+    "sequence": "sequence_payload",
+    "bytes": "bytes_payload",
+    "file": "file_payload",
+    "pickle": "pickle_payload",
+}
+
+
+def format_validation_error(item: dict[str, object], *, root: str | None = None) -> str:
+    """Format one pydantic error into a short, readable message.
+
+    ``root`` prefixes the error location when the validated data sits inside a larger
+    config, such as a payload validated again after template expansion.
+    """
+
+    loc = item.get("loc") or ()
+    field_path = root
+    for value in loc if isinstance(loc, tuple) else (loc,):
+        # Pydantic locations hold only str keys and int indexes, so an exact type
+        # check is enough.
+        if type(value) is int:
+            field_path = f"{field_path or ''}[{value}]"
+        elif field_path is None:
+            field_path = str(value)
+        else:
+            field_path = f"{field_path}.{value}"
+    message = str(item.get("msg", "validation error"))
+    return f"{field_path if field_path is not None else '<root>'}: {message}"
+
 
 def _ensure_named_mapping(
     value: object,
@@ -227,6 +259,12 @@ def _validate_generator(value: dict[str, Any], *, path: str) -> dict[str, Any]:
     if operator == "expr":
         if not isinstance(raw, str) or not raw.strip():
             raise ValueError(f"{path}.expr must be a non-empty string")
+        # Templated expressions are only checked once ``${name}`` has been expanded.
+        if "${" not in raw:
+            try:
+                compile(raw, "<expr>", "eval")
+            except SyntaxError as exc:
+                raise ValueError(f"{path}.expr is not a valid expression: {exc.msg}") from exc
         return {"expr": raw}
     if operator == "time":
         if raw not in {"iso", "unix"}:
@@ -284,6 +322,10 @@ class BrokerConfig(BaseModel):
     keepalive: int = 60
     protocol: Literal["3.1.1", "5.0"] = "3.1.1"
     transport: Literal["tcp", "websockets"] = "tcp"
+    max_inflight: int = Field(default=1000, ge=1)
+    max_queued: int = Field(default=0, ge=0)
+    max_rate: float | None = Field(default=None, gt=0)
+    max_burst: int | None = Field(default=None, ge=1)
     auth: BrokerAuthConfig | None = None
     tls: BrokerTlsConfig | None = None
 
@@ -292,6 +334,12 @@ class BrokerConfig(BaseModel):
     def _parse_keepalive(cls, value: object) -> int:
         return parse_keepalive(value)
 
+    @model_validator(mode="after")
+    def _validate_rate_limit(self) -> BrokerConfig:
+        if self.max_burst is not None and self.max_rate is None:
+            raise ValueError("max_burst requires max_rate")
+        return self
+
 
 class TextPayloadConfig(BaseModel):
     """Inline UTF-8 text payload."""
@@ -383,18 +431,7 @@ class PayloadConfig(BaseModel):
 
     @model_validator(mode="after")
     def _validate_one_of(self) -> PayloadConfig:
-        selected = [
-            name
-            for name in (
-                "text_payload",
-                "json_payload",
-                "sequence_payload",
-                "bytes_payload",
-                "file_payload",
-                "pickle_payload",
-            )
-            if getattr(self, name) is not None
-        ]
+        selected = [name for name in _PAYLOAD_FIELDS.values() if getattr(self, name) is not None]
         if len(selected) != 1:
             raise ValueError(
                 "payload must define exactly one of text, json, sequence, bytes, file, or pickle"
@@ -405,23 +442,16 @@ class PayloadConfig(BaseModel):
     def kind(self) -> str:
         """Return the configured payload type name."""
 
-        for name in (
-            "text_payload",
-            "json_payload",
-            "sequence_payload",
-            "bytes_payload",
-            "file_payload",
-            "pickle_payload",
-        ):
+        for kind, name in _PAYLOAD_FIELDS.items():
             if getattr(self, name) is not None:
-                return name.removesuffix("_payload")
+                return kind
         raise RuntimeError("PayloadConfig.kind accessed before validation")
 
     @property
     def spec(self) -> BaseModel | JsonPayloadConfig:
         """Return the concrete payload config model."""
 
-        payload = getattr(self, f"{self.kind}_payload")
+        payload = getattr(self, _PAYLOAD_FIELDS[self.kind])
         assert payload is not None
         return payload
 
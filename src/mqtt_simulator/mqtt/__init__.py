@@ -1,7 +1,13 @@
 """MQTT adapter interfaces and implementations."""
 
-from .adapter import BrokerAdapter, PublishResult
+from .adapter import BrokerAdapter, PublishRequest, PublishResult
 from .fake_adapter import FakeBrokerAdapter
 from .paho_adapter import PahoBrokerAdapter
 
-__all__ = ["BrokerAdapter", "FakeBrokerAdapter", "PahoBrokerAdapter", "PublishResult"]
+__all__ = [
+    "BrokerAdapter",
+    "FakeBrokerAdapter",
+    "PahoBrokerAdapter",
+    "PublishRequest",
+    "PublishResult",
+]
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Protocol
 
+from ..errors import BrokerPublishError
+
 
 @dataclass(slots=True)
 class PublishResult:
@@ -13,6 +16,16 @@ class PublishResult:
     message_id: int | None = None
 
 
+@dataclass(slots=True)
+class PublishRequest:
+    """One message submitted through ``BrokerAdapter.publish_many``."""
+
+    topic: str
+    payload: bytes
+    qos: int = 0
+    retain: bool = False
+
+
 class BrokerAdapter(Protocol):
     """Async protocol implemented by broker publishing adapters."""
 
@@ -29,5 +42,14 @@ class BrokerAdapter(Protocol):
     ) -> PublishResult:
         """Publish one MQTT message."""
 
+    async def publish_many(
+        self, messages: Sequence[PublishRequest]
+    ) -> list[PublishResult | BrokerPublishError]:
+        """Publish a batch of messages in order.
+
+        Per-message failures are returned in place of their result instead of raised, so
+        one bad topic does not hide the outcome of the rest of the batch.
+        """
+
     async def close(self) -> None:
         """Close the broker connection and release resources."""
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from ..errors import BrokerConnectionError, BrokerPublishError
-from .adapter import PublishResult
+from .adapter import PublishRequest, PublishResult
 
 
 @dataclass(slots=True)
@@ -16,7 +17,17 @@ class FakeBrokerAdapter:
     fail_topics: set[str] = field(default_factory=set)
     fail_after: int | None = None
     connected: bool = False
-    published: list[tuple[str, bytes, int, bool]] = field(default_factory=list)
+    # Recorded publishes are kept column-wise so tests can scan one field directly.
+    topics: list[str] = field(default_factory=list)
+    payloads: list[bytes] = field(default_factory=list)
+    qos_levels: list[int] = field(default_factory=list)
+    retain_flags: list[bool] = field(default_factory=list)
+
+    @property
+    def published(self) -> list[tuple[str, bytes, int, bool]]:
+        """Return recorded publishes as ``(topic, payload, qos, retain)`` tuples."""
+
+        return list(zip(self.topics, self.payloads, self.qos_levels, self.retain_flags))
 
     async def connect(self) -> None:
         """Simulate connecting to a broker."""
@@ -39,10 +50,30 @@ class FakeBrokerAdapter:
             raise BrokerPublishError("Fake broker is not connected.")
         if topic in self.fail_topics:
             raise BrokerPublishError(f"Fake publish failure for topic '{topic}'.")
-        if self.fail_after is not None and len(self.published) >= self.fail_after:
+        if self.fail_after is not None and len(self.topics) >= self.fail_after:
             raise BrokerPublishError("Fake publish failure after configured count.")
-        self.published.append((topic, payload, qos, retain))
-        return PublishResult(message_id=len(self.published))
+        self.topics.append(topic)
+        self.payloads.append(payload)
+        self.qos_levels.append(qos)
+        self.retain_flags.append(retain)
+        return PublishResult(message_id=len(self.topics))
+
+    async def publish_many(
+        self, messages: Sequence[PublishRequest]
+    ) -> list[PublishResult | BrokerPublishError]:
+        """Record a batch of publishes, returning simulated errors in place."""
+
+        results: list[PublishResult | BrokerPublishError] = []
+        for message in messages:
+            try:
+                results.append(
+                    await self.publish(
+                        message.topic, message.payload, qos=message.qos, retain=message.retain
+                    )
+                )
+            except BrokerPublishError as exc:
+                results.append(exc)
+        return results
 
     async def close(self) -> None:
         """Simulate closing the broker connection."""
@@ -6,12 +6,13 @@ import asyncio
 import logging
 import os
 import threading
+from collections.abc import Sequence
 
 import paho.mqtt.client as mqtt
 
 from ..errors import BrokerConnectionError, BrokerPublishError
 from ..runtime.models import RuntimeClient
-from .adapter import PublishResult
+from .adapter import PublishRequest, PublishResult
 
 
 class PahoBrokerAdapter:
@@ -48,6 +49,9 @@ class PahoBrokerAdapter:
         client = mqtt.Client(
             **client_kwargs,
         )
+        # Let Paho's inflight window, not per-message waits, regulate QoS 1/2 throughput.
+        client.max_inflight_messages_set(self._broker.max_inflight)
+        client.max_queued_messages_set(self._broker.max_queued)
         if self._broker.auth is not None:
             password = self._broker.auth.password
             if password is None and self._broker.auth.password_env:
@@ -117,7 +121,7 @@ class PahoBrokerAdapter:
         qos: int = 0,
         retain: bool = False,
     ) -> PublishResult:
-        """Publish one message and wait for the client library to finish."""
+        """Publish one message, waiting for QoS 1/2 completion in a worker thread."""
 
         if self._client is None:
             raise BrokerPublishError(f"Broker '{self._broker.name}' is not connected.")
@@ -128,9 +132,53 @@ class PahoBrokerAdapter:
                 f"'{topic}' on broker '{self._broker.name}' "
                 f"(rc={info.rc})."
             )
-        await asyncio.to_thread(info.wait_for_publish)
+        if qos > 0:
+            # QoS 0 has no acknowledgement to wait for; skip the worker-thread hop.
+            await asyncio.to_thread(info.wait_for_publish)
         return PublishResult(message_id=info.mid)
 
+    async def publish_many(
+        self, messages: Sequence[PublishRequest]
+    ) -> list[PublishResult | BrokerPublishError]:
+        """Queue a batch of messages back to back and wait for them in one thread hop.
+
+        Paho's ``publish`` only enqueues for the network thread, so every message is
+        submitted first; QoS 1/2 completions are then awaited together. QoS 0 messages
+        are fire-and-forget and are not waited on.
+        """
+
+        if self._client is None:
+            raise BrokerPublishError(f"Broker '{self._broker.name}' is not connected.")
+        client = self._client
+        results: list[PublishResult | BrokerPublishError] = []
+        pending: list[tuple[int, mqtt.MQTTMessageInfo]] = []
+        for message in messages:
+            info = client.publish(
+                message.topic, payload=message.payload, qos=message.qos, retain=message.retain
+            )
+            if info.rc != mqtt.MQTT_ERR_SUCCESS:
+                results.append(
+                    BrokerPublishError(
+                        "Publish failed for topic "
+                        f"'{message.topic}' on broker '{self._broker.name}' "
+                        f"(rc={info.rc})."
+                    )
+                )
+                continue
+            if message.qos > 0:
+                pending.append((len(results), info))
+            results.append(PublishResult(message_id=info.mid))
+        if pending:
+            failures = await asyncio.to_thread(_wait_for_all, [info for _, info in pending])
+            for (index, _), failure in zip(pending, failures, strict=True):
+                if failure is not None:
+                    results[index] = BrokerPublishError(
+                        "Publish failed for topic "
+                        f"'{messages[index].topic}' on broker '{self._broker.name}' "
+                        f"({failure})."
+                    )
+        return results
+
     async def close(self) -> None:
         """Disconnect and stop the Paho network loop."""
 
@@ -174,6 +222,23 @@ class PahoBrokerAdapter:
         self._logger.debug("Broker disconnected rc=%s", _reason_code_value(reason_code))
 
 
+def _wait_for_all(infos: list[mqtt.MQTTMessageInfo]) -> list[str | None]:
+    """Block until every queued message has been handed off by Paho.
+
+    Returns one entry per info: ``None`` on success, otherwise the failure reason.
+    """
+
+    failures: list[str | None] = []
+    for info in infos:
+        try:
+            info.wait_for_publish()
+        except (RuntimeError, ValueError) as exc:
+            failures.append(str(exc))
+            continue
+        failures.append(None)
+    return failures
+
+
 def _reason_code_value(reason_code: object) -> int:
     """Return a stable integer-like code from Paho callback reason codes.
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TextIO
+from typing import ClassVar, TextIO
 
 from rich.console import Console
 
@@ -15,16 +15,28 @@ from ..runtime.models import RuntimeResult, RuntimeSnapshot
 class LogRenderer:
     """Emit compact progress and final summaries as plain log lines."""
 
+    # Every batch is logged, so per-publish PUB and ERROR lines are not merged.
+    coalesce_updates: ClassVar[bool] = False
+
     stream: TextIO | None = None
     verbose: bool = False
     _console: Console = field(init=False, repr=False)
     _last_seen_counts: dict[str, tuple[int, int]] = field(init=False, repr=False)
+    _last_totals: tuple[int, int] | None = field(init=False, repr=False, default=None)
     _started: bool = field(init=False, repr=False, default=False)
 
     def __post_init__(self) -> None:
         """Initialize the Rich console wrapper."""
 
-        self._console = Console(file=self.stream, force_terminal=False)
+        # Log lines are plain text: skip Rich's markup, emoji and highlight passes so
+        # topics or errors containing "[...]" or ":name:" are printed verbatim.
+        self._console = Console(
+            file=self.stream,
+            force_terminal=False,
+            highlight=False,
+            markup=False,
+            emoji=False,
+        )
         self._last_seen_counts: dict[str, tuple[int, int]] = {}
 
     def start(self, snapshot: RuntimeSnapshot) -> None:
@@ -42,6 +54,13 @@ class LogRenderer:
     def update(self, snapshot: RuntimeSnapshot) -> None:
         """Emit error transitions and optional verbose progress lines."""
 
+        # Per-stream counters only grow and are included in the totals, so unchanged
+        # totals mean no stream has anything new to report.
+        totals = (snapshot.total_publishes, snapshot.total_errors)
+        if totals == self._last_totals:
+            return
+        self._last_totals = totals
+
         for stream in snapshot.streams:
             key = stream.stream_id
             current = (stream.publish_count, stream.error_count)
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import time
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import TextIO
+from functools import lru_cache
+from typing import ClassVar, TextIO
 
 from rich import box
 from rich.console import Console, RenderableType
@@ -33,15 +33,23 @@ _STATE_BADGES: dict[str, tuple[str, str]] = {
 class TableRenderer:
     """Render runtime snapshots as an inline-updating table."""
 
+    # Redrawing faster than Live's refresh rate only burns CPU.
+    coalesce_updates: ClassVar[bool] = True
+
     stream: TextIO | None = None
     _console: Console = field(init=False, repr=False)
     _live: Live | None = field(init=False, repr=False, default=None)
+    # Topic and schedule cells never change for a stream, so their Text objects are
+    # built once and reused by every table rebuild.
+    _static_cells: dict[str, tuple[Text, Text]] = field(
+        init=False, repr=False, default_factory=dict
+    )
 
     def __post_init__(self) -> None:
         """Create the console and initialize live rendering state."""
         # Let Rich auto-detect color/TTY;
         # CLI can pick this renderer only when isatty() is true.
-        self._console = Console(file=self.stream, highlight=False)
+        self._console = Console(file=self.stream, highlight=False, emoji=False)
 
     def start(self, snapshot) -> None:
         """Start the Rich live display."""
@@ -147,11 +155,16 @@ class TableRenderer:
         """Format one stream status row for the table."""
         state_cell = _format_state(getattr(stream, "state", ""))
         last_pub = _format_ts(getattr(stream, "last_publish_ts", None), now)
+        static = self._static_cells.get(stream.stream_id)
+        if static is None:
+            static = (Text(str(stream.topic)), Text(str(stream.schedule_label)))
+            self._static_cells[stream.stream_id] = static
+        topic_cell, schedule_cell = static
 
         return (
-            Text(str(stream.topic)),
+            topic_cell,
             state_cell,
-            Text(str(stream.schedule_label)),
+            schedule_cell,
             Text(str(stream.publish_count)),
             Text(last_pub),
             Text(str(stream.last_payload_preview or "-")),
@@ -173,10 +186,16 @@ def _format_ts(value: float | None, now: float) -> str:
     """Format a wall-clock timestamp with an 'ago' suffix."""
     if value is None:
         return "-"
-    dt = datetime.fromtimestamp(value).strftime("%H:%M:%S")
+    dt = _format_clock(int(value))
     ago = max(0.0, now - value)
     if ago < 60:
         return f"{dt} ({ago:>4.1f}s)"
     mins = int(ago // 60)
     secs = int(ago % 60)
     return f"{dt} ({mins}m{secs:02d}s)"
+
+
+@lru_cache(maxsize=1024)
+def _format_clock(second: int) -> str:
+    """Return local ``HH:MM:SS`` for a whole epoch second (rows share recent seconds)."""
+    return time.strftime("%H:%M:%S", time.localtime(second))
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Protocol
 
 
 class Clock(Protocol):
-    """Clock protocol for monotonic and wall time access."""
+    """Clock protocol for monotonic and wall time access and for waiting."""
 
     def monotonic(self) -> float:
         """Return monotonic time in seconds."""
@@ -15,6 +16,9 @@ class Clock(Protocol):
     def time(self) -> float:
         """Return wall time in seconds since epoch."""
 
+    async def sleep(self, seconds: float) -> None:
+        """Wait until ``seconds`` of monotonic time have passed."""
+
 
 class SystemClock:
     """Default clock implementation backed by the Python standard library."""
@@ -28,3 +32,8 @@ class SystemClock:
         """Return system wall-clock time."""
 
         return time.time()
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep on the running event loop."""
+
+        await asyncio.sleep(seconds)
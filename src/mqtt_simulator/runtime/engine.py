@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import heapq
 import logging
 import random
@@ -10,7 +9,8 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 
 from ..errors import BrokerPublishError
-from ..mqtt.adapter import BrokerAdapter
+from ..mqtt.adapter import BrokerAdapter, PublishRequest
+from ..sim.seeding import stable_seed
 from .clock import Clock, SystemClock
 from .models import (
     Renderer,
@@ -23,6 +23,8 @@ from .models import (
 from .status import build_snapshot
 
 AdapterFactory = Callable[[RuntimeClient], BrokerAdapter]
+# A built message waiting for its session's publish_many call, plus its preview.
+_OutgoingPublish = tuple[RuntimeStream, StreamStatus, PublishRequest, str]
 
 
 @dataclass(slots=True)
@@ -32,6 +34,40 @@ class _ScheduleState:
     jitter_rng: random.Random = field(default_factory=random.Random)
     burst_emitted: int = 0
     cycle_anchor: float | None = None
+    # Set when the stream was deferred by its broker's rate limit and already owns the
+    # token it will publish with.
+    rate_slot_reserved: bool = False
+
+
+@dataclass(slots=True)
+class _TokenBucket:
+    """Token bucket that paces one client session to a messages-per-second rate."""
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated_at: float
+
+    @classmethod
+    def create(cls, rate: float, *, burst: int | None, now: float) -> _TokenBucket:
+        """Create a full bucket; the burst defaults to one second's worth of messages."""
+
+        capacity = float(burst if burst is not None else max(1, int(rate)))
+        return cls(rate=rate, capacity=capacity, tokens=capacity, updated_at=now)
+
+    def reserve(self, now: float) -> float:
+        """Take one token and return how many seconds remain until it is covered.
+
+        The balance may go negative, so each caller that has to wait is given its own
+        later slot instead of all of them retrying for the same token.
+        """
+
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        self.tokens -= 1.0
+        if self.tokens >= 0.0:
+            return 0.0
+        return -self.tokens / self.rate
 
 
 @dataclass(slots=True)
@@ -46,12 +82,14 @@ class SimulationEngine:
     fail_fast: bool = False
     duration: float | None = None
     clock: Clock = field(default_factory=SystemClock)
+    render_interval: float = 0.125
 
     async def run(self) -> RuntimeResult:
         """Execute the simulation and return the final runtime result."""
 
         started_mono = self.clock.monotonic()
         started_wall = self.clock.time()
+        # Index-aligned with self.streams so the scheduler can use heap indices directly.
         statuses = [
             StreamStatus(
                 stream_id=stream.stream_id,
@@ -60,7 +98,6 @@ class SimulationEngine:
             )
             for stream in self.streams
         ]
-        status_by_id = {status.stream_id: status for status in statuses}
         total_publishes = 0
         total_errors = 0
         failed_fast = False
@@ -69,6 +106,23 @@ class SimulationEngine:
         renderer_started = False
         fatal_exception: Exception | None = None
 
+        def record_error(stream: RuntimeStream, status: StreamStatus, exc: Exception) -> None:
+            nonlocal total_errors, failed_fast
+            total_errors += 1
+            status.error_count += 1
+            status.state = "error"
+            status.last_error = str(exc)
+            if isinstance(exc, BrokerPublishError):
+                self.logger.error("Publish error for %s: %s", stream.stream_id, exc)
+            else:
+                self.logger.error(
+                    "Unhandled stream error for %s",
+                    stream.stream_id,
+                    exc_info=(type(exc), exc, exc.__traceback__),
+                )
+            if self.fail_fast:
+                failed_fast = True
+
         async def emit_update() -> RuntimeSnapshot:
             nonlocal renderer_started
             snapshot = build_snapshot(
@@ -114,88 +168,168 @@ class SimulationEngine:
             if failed_fast:
                 raise BrokerPublishError("Client lifecycle publish failed during startup.")
 
+            # Renders are coalesced unless the renderer opts out: publishes only mark the
+            # display dirty, and a snapshot is emitted at most once per render interval or
+            # before the loop goes idle.
+            dirty = False
+            next_render_at = self.clock.monotonic() + self.render_interval
             due_heap: list[tuple[float, int]] = []
             schedule_states: list[_ScheduleState] = []
             now_mono = self.clock.monotonic()
             for index, stream in enumerate(self.streams):
                 schedule_states.append(
-                    _ScheduleState(
-                        jitter_rng=random.Random(hash(stream.stream_id) & 0xFFFFFFFFFFFF)
-                    )
+                    _ScheduleState(jitter_rng=random.Random(stable_seed(stream.stream_id)))
                 )
                 heapq.heappush(due_heap, (now_mono, index))
+            # Throttled streams are pushed back onto the heap rather than slept on, so a
+            # rate-limited broker never delays streams bound to other brokers.
+            rate_limits = {
+                session_id: _TokenBucket.create(
+                    client.broker.max_rate, burst=client.broker.max_burst, now=now_mono
+                )
+                for session_id, client in self.clients.items()
+                if client.broker.max_rate is not None
+            }
+
+            # Hot-loop references bound to locals once.
+            monotonic = self.clock.monotonic
+            wall_time = self.clock.time
+            sleep = self.clock.sleep
+            streams = self.streams
+            duration = self.duration
+            render_interval = self.render_interval
+            coalesce_updates = self.renderer.coalesce_updates
+            log_debug = self.logger.debug
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            heappush = heapq.heappush
+            heappop = heapq.heappop
 
             while due_heap:
-                now_mono = self.clock.monotonic()
-                if self.duration is not None and (now_mono - started_mono) >= self.duration:
+                now_mono = monotonic()
+                if duration is not None and (now_mono - started_mono) >= duration:
                     break
 
-                due_at, stream_index = heapq.heappop(due_heap)
+                due_at, stream_index = heappop(due_heap)
                 if due_at > now_mono:
+                    if dirty and due_at >= next_render_at:
+                        await emit_update()
+                        dirty = False
+                        next_render_at = now_mono + render_interval
                     remaining = due_at - now_mono
-                    if self.duration is not None:
-                        time_left = max(0.0, self.duration - (now_mono - started_mono))
+                    if duration is not None:
+                        time_left = max(0.0, duration - (now_mono - started_mono))
                         remaining = min(remaining, time_left)
                     if remaining > 0:
-                        await asyncio.sleep(remaining)
-                    now_mono = self.clock.monotonic()
-                    if self.duration is not None and (now_mono - started_mono) >= self.duration:
+                        await sleep(remaining)
+                    now_mono = monotonic()
+                    if duration is not None and (now_mono - started_mono) >= duration:
                         break
 
-                stream = self.streams[stream_index]
-                status = status_by_id[stream.stream_id]
-                status.state = "running"
-                status.last_error = ""
-
-                try:
-                    build_result = stream.payload_builder.build()
-                    adapter = adapters[stream.client_session_id]
-                    await adapter.publish(
-                        stream.topic,
-                        build_result.payload_bytes,
-                        qos=stream.qos,
-                        retain=stream.retain,
+                # Drain every stream that is already due so each session gets one
+                # publish_many call and the batch shares one renderer update.
+                batch = [(due_at, stream_index)]
+                while due_heap and due_heap[0][0] <= now_mono:
+                    batch.append(heappop(due_heap))
+
+                outgoing: dict[str, list[_OutgoingPublish]] = {}
+                deferred: set[int] = set()
+                for _, stream_index in batch:
+                    stream = streams[stream_index]
+                    if rate_limits:
+                        state = schedule_states[stream_index]
+                        bucket = rate_limits.get(stream.client_session_id)
+                        if state.rate_slot_reserved:
+                            state.rate_slot_reserved = False
+                        elif bucket is not None:
+                            wait = bucket.reserve(now_mono)
+                            if wait > 0.0:
+                                state.rate_slot_reserved = True
+                                deferred.add(stream_index)
+                                heappush(due_heap, (now_mono + wait, stream_index))
+                                continue
+                    status = statuses[stream_index]
+                    status.state = "running"
+                    status.last_error = ""
+                    try:
+                        build_result = stream.payload_builder.build()
+                    except Exception as exc:
+                        record_error(stream, status, exc)
+                        if failed_fast:
+                            break
+                        continue
+                    outgoing.setdefault(stream.client_session_id, []).append(
+                        (
+                            stream,
+                            status,
+                            PublishRequest(
+                                stream.topic,
+                                build_result.payload_bytes,
+                                qos=stream.qos,
+                                retain=stream.retain,
+                            ),
+                            build_result.preview,
+                        )
                     )
-                    total_publishes += 1
-                    status.publish_count += 1
-                    status.last_publish_ts = self.clock.time()
-                    status.last_payload_preview = build_result.preview
-                    status.state = "ok"
-                    self.logger.debug(
-                        "Published stream_id=%s topic=%s bytes=%d",
-                        stream.stream_id,
-                        stream.topic,
-                        len(build_result.payload_bytes),
-                    )
-                except BrokerPublishError as exc:
-                    total_errors += 1
-                    status.error_count += 1
-                    status.state = "error"
-                    status.last_error = str(exc)
-                    self.logger.error("Publish error for %s: %s", stream.stream_id, exc)
-                    if self.fail_fast:
-                        failed_fast = True
-                except Exception as exc:
-                    total_errors += 1
-                    status.error_count += 1
-                    status.state = "error"
-                    status.last_error = str(exc)
-                    self.logger.exception("Unhandled stream error for %s", stream.stream_id)
-                    if self.fail_fast:
-                        failed_fast = True
 
+                # Messages built before a fail-fast build error are still published; only
+                # a publish failure stops the remaining sessions in the batch.
+                for session_id, entries in outgoing.items():
+                    try:
+                        results = await adapters[session_id].publish_many(
+                            [request for _, _, request, _ in entries]
+                        )
+                    except Exception as exc:
+                        for stream, status, _, _ in entries:
+                            record_error(stream, status, exc)
+                        if self.fail_fast:
+                            break
+                        continue
+                    # One wall-clock read covers the whole session batch.
+                    published_at = wall_time()
+                    session_failed = False
+                    for (stream, status, request, preview), outcome in zip(
+                        entries, results, strict=True
+                    ):
+                        if isinstance(outcome, Exception):
+                            record_error(stream, status, outcome)
+                            session_failed = True
+                            continue
+                        total_publishes += 1
+                        status.publish_count += 1
+                        status.last_publish_ts = published_at
+                        status.last_payload_preview = preview
+                        status.state = "ok"
+                        if debug_enabled:
+                            log_debug(
+                                "Published stream_id=%s topic=%s bytes=%d",
+                                stream.stream_id,
+                                stream.topic,
+                                len(request.payload),
+                            )
+                    if session_failed and self.fail_fast:
+                        break
+
+                if not failed_fast:
+                    now_mono = monotonic()
+                    for due_at, stream_index in batch:
+                        if stream_index in deferred:
+                            continue
+                        next_due = _next_due(
+                            stream=streams[stream_index],
+                            state=schedule_states[stream_index],
+                            due_at=due_at,
+                            now=now_mono,
+                        )
+                        heappush(due_heap, (next_due, stream_index))
+
+                dirty = True
                 if failed_fast:
                     await emit_update()
                     break
-
-                next_due = _next_due(
-                    stream=stream,
-                    state=schedule_states[stream_index],
-                    due_at=due_at,
-                    now=self.clock.monotonic(),
-                )
-                heapq.heappush(due_heap, (next_due, stream_index))
-                await emit_update()
+                if not coalesce_updates or now_mono >= next_render_at:
+                    await emit_update()
+                    dirty = False
+                    next_render_at = now_mono + render_interval
         except Exception as exc:
             fatal_exception = exc
             raise
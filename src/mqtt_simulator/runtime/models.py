@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import ClassVar, Protocol
 
 from ..config.models import BrokerConfig
 from ..mqtt.adapter import PublishResult
@@ -13,6 +13,10 @@ from ..sim.payloads import PayloadBuilder, PayloadBuildResult
 class Renderer(Protocol):
     """Renderer protocol consumed by the runtime engine."""
 
+    # When true, the engine limits updates to one per render interval; when false it
+    # calls ``update`` after every publish batch so no intermediate state is skipped.
+    coalesce_updates: ClassVar[bool]
+
     def start(self, snapshot: RuntimeSnapshot) -> None:
         """Initialize rendering for a simulation session."""
 
@@ -91,6 +95,21 @@ class StreamStatus:
     last_error: str = ""
     error_count: int = 0
 
+    def snapshot(self) -> StreamStatus:
+        """Return a detached copy; cheaper than ``dataclasses.replace`` per tick."""
+
+        return StreamStatus(
+            self.stream_id,
+            self.topic,
+            self.schedule_label,
+            self.state,
+            self.publish_count,
+            self.last_publish_ts,
+            self.last_payload_preview,
+            self.last_error,
+            self.error_count,
+        )
+
 
 @dataclass(slots=True)
 class RuntimeSnapshot:
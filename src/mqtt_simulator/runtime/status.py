@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from dataclasses import replace
-
 from .models import RuntimeSnapshot, StreamStatus
 
 
@@ -20,7 +18,7 @@ def build_snapshot(
     return RuntimeSnapshot(
         started_at=started_at,
         now=now,
-        streams=[replace(status) for status in statuses],
+        streams=[status.snapshot() for status in statuses],
         total_publishes=total_publishes,
         total_errors=total_errors,
     )
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import ast
 import copy
 import math
+import os
 import random
 import time
-import uuid
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import lru_cache, partial
 from typing import Any, Protocol
 
 from ..errors import PayloadBuildError
 
+# Values that can be handed out repeatedly without copying.
+IMMUTABLE_TYPES = (bool, int, float, str)
+_CHOICE_BATCH_SIZE = 256
+# ``choices`` scales a 53-bit float, so integer ranges wider than this keep ``randint``.
+_BATCHED_INT_SPAN = 2**32
+
 
 class ValueGenerator(Protocol):
     """Protocol for stateful generators that emit one value per publish."""
@@ -28,27 +37,10 @@ def build_value_generator(spec: dict[str, Any], *, rng: random.Random) -> ValueG
         raise PayloadBuildError("Generator specs must contain exactly one operator")
 
     operator, data = next(iter(spec.items()))
-    if operator == "toggle":
-        return BoolToggleGenerator(value=bool(data))
-    if operator == "walk":
-        return NumberWalkGenerator.from_spec(data)
-    if operator == "random":
-        return NumberRandomGenerator.from_spec(data, rng=rng)
-    if operator == "pick":
-        return ChoiceGenerator.from_spec(data, rng=rng)
-    if operator == "seq":
-        return SequenceGenerator.from_spec(data)
-    if operator == "expr":
-        return ExpressionGenerator.from_spec(str(data), rng=rng)
-    if operator == "time":
-        return TimestampGenerator.from_spec(str(data))
-    if operator == "uuid":
-        return UUIDGenerator()
-    if operator == "counter":
-        return CounterGenerator.from_spec(data)
-    if operator == "null":
-        return NullGenerator()
-    raise PayloadBuildError(f"Unsupported generator operator: {operator}")
+    factory = _GENERATOR_FACTORIES.get(operator)
+    if factory is None:
+        raise PayloadBuildError(f"Unsupported generator operator: {operator}")
+    return factory(data, rng)
 
 
 @dataclass(slots=True)
@@ -74,6 +66,13 @@ class NumberWalkGenerator:
     number_type: str = "float"
     current: float | None = None
     direction: int = 1
+    _delta: float = field(init=False, repr=False)
+    _cast: Callable[[float], int | float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._delta = self.step * self.direction
+        # ``round`` with no digits already returns an int.
+        self._cast = round if self.number_type == "int" else float
 
     @classmethod
     def from_spec(cls, data: dict[str, Any]) -> NumberWalkGenerator:
@@ -99,15 +98,18 @@ class NumberWalkGenerator:
 
         assert self.current is not None
         value = self.current
-        next_value = value + (self.step * self.direction)
-        if next_value > self.maximum or next_value < self.minimum:
-            self.direction *= -1
-            next_value = value + (self.step * self.direction)
-            next_value = min(self.maximum, max(self.minimum, next_value))
+        next_value = value + self._delta
+        if not self.minimum <= next_value <= self.maximum:
+            # The signed step is kept precomputed; reversing is a single negation.
+            self.direction = -self.direction
+            self._delta = -self._delta
+            next_value = value + self._delta
+            if next_value > self.maximum:
+                next_value = self.maximum
+            elif next_value < self.minimum:
+                next_value = self.minimum
         self.current = next_value
-        if self.number_type == "int":
-            return int(round(value))
-        return float(value)
+        return self._cast(value)
 
 
 @dataclass(slots=True)
@@ -119,6 +121,25 @@ class NumberRandomGenerator:
     number_type: str
     precision: int | None
     rng: random.Random = field(repr=False)
+    _draw: Callable[[], int | float] = field(init=False, repr=False)
+    _digits: int | None = field(init=False, repr=False)
+    _population: range = field(default=range(0), init=False, repr=False)
+    _batch: list[int] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Bind the RNG draw for the configured number type once."""
+
+        if self.number_type == "int":
+            low, high = int(self.minimum), int(self.maximum)
+            if high - low < _BATCHED_INT_SPAN:
+                self._population = range(low, high + 1)
+                self._draw = self._draw_batched_int
+            else:
+                self._draw = partial(self.rng.randint, low, high)
+            self._digits = None
+        else:
+            self._draw = partial(self.rng.uniform, self.minimum, self.maximum)
+            self._digits = self.precision
 
     @classmethod
     def from_spec(
@@ -143,13 +164,20 @@ class NumberRandomGenerator:
     def next_value(self) -> int | float:
         """Return a random number in range."""
 
-        if self.number_type == "int":
-            return self.rng.randint(int(self.minimum), int(self.maximum))
-        value = self.rng.uniform(self.minimum, self.maximum)
-        if self.precision is not None:
-            value = round(value, self.precision)
+        value = self._draw()
+        if self._digits is not None:
+            value = round(value, self._digits)
         return value
 
+    def _draw_batched_int(self) -> int:
+        """Return the next integer from a buffer refilled by one ``choices`` call."""
+
+        batch = self._batch
+        if not batch:
+            # ``randint`` runs several Python-level calls per value; ``choices`` is one C loop.
+            batch = self._batch = self.rng.choices(self._population, k=_CHOICE_BATCH_SIZE)
+        return batch.pop()
+
 
 @dataclass(slots=True)
 class ChoiceGenerator:
@@ -157,6 +185,14 @@ class ChoiceGenerator:
 
     values: list[Any]
     rng: random.Random = field(repr=False)
+    _batch: list[Any] = field(default_factory=list, init=False, repr=False)
+    _copy: bool = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Only containers can be mutated by callers, so scalar picks skip the deepcopy.
+        self._copy = not all(
+            value is None or isinstance(value, IMMUTABLE_TYPES) for value in self.values
+        )
 
     @classmethod
     def from_spec(cls, values: list[Any], *, rng: random.Random) -> ChoiceGenerator:
@@ -167,7 +203,12 @@ class ChoiceGenerator:
     def next_value(self) -> Any:
         """Return a random choice."""
 
-        return copy.deepcopy(self.rng.choice(self.values))
+        batch = self._batch
+        if not batch:
+            # ``choices`` draws a whole batch in one C loop; picks are dispensed from it.
+            batch = self._batch = self.rng.choices(self.values, k=_CHOICE_BATCH_SIZE)
+        value = batch.pop()
+        return copy.deepcopy(value) if self._copy else value
 
 
 @dataclass(slots=True)
@@ -177,6 +218,10 @@ class SequenceGenerator:
     values: list[Any]
     loop: bool
     index: int = 0
+    _size: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._size = len(self.values)
 
     @classmethod
     def from_spec(cls, values: list[Any]) -> SequenceGenerator:
@@ -187,7 +232,7 @@ class SequenceGenerator:
     def next_value(self) -> Any:
         """Return the next sequence value."""
 
-        if self.index >= len(self.values):
+        if self.index >= self._size:
             if not self.loop:
                 return self.values[-1]
             self.index = 0
@@ -209,6 +254,15 @@ class ExpressionGenerator:
     rng: random.Random = field(repr=False)
     prev: Any = None
     count: int = 0
+    _evaluate: Callable[..., Any] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Compile the expression once so publishes only run bytecode."""
+
+        try:
+            self._evaluate = _compile_expression(self.expression)
+        except SyntaxError as exc:
+            raise PayloadBuildError(f"expression generator is not valid: {exc}") from exc
 
     @classmethod
     def from_spec(cls, expression: str, *, rng: random.Random) -> ExpressionGenerator:
@@ -221,19 +275,10 @@ class ExpressionGenerator:
     def next_value(self) -> Any:
         """Evaluate the expression and store the returned value as ``prev``."""
 
-        local_vars = {
-            "prev": self.prev,
-            "count": self.count,
-            "random": self.rng.random(),
-            "randint": self.rng.randint,
-            "uniform": self.rng.uniform,
-            "time": time.time(),
-        }
+        rng = self.rng
         try:
-            value = eval(  # noqa: S307
-                self.expression,
-                {"__builtins__": {}, "math": math},
-                local_vars,
+            value = self._evaluate(
+                self.prev, self.count, rng.random(), rng.randint, rng.uniform, time.time()
             )
         except Exception as exc:  # pragma: no cover - exact errors vary by expression
             raise PayloadBuildError(f"expression generator failed: {exc}") from exc
@@ -242,11 +287,43 @@ class ExpressionGenerator:
         return value
 
 
+# Shared, read-only globals for expression evaluation; ``eval`` never writes to a
+# globals mapping that already defines ``__builtins__``.
+_EXPRESSION_GLOBALS: dict[str, Any] = {"__builtins__": {}, "math": math}
+# Names visible to expressions, in the order ``next_value`` passes them.
+_EXPRESSION_ARGS = ("prev", "count", "random", "randint", "uniform", "time")
+
+
+@lru_cache(maxsize=256)
+def _compile_expression(expression: str) -> Callable[..., Any]:
+    """Compile an expression into a function shared by streams using the same text.
+
+    The expression becomes the body of a lambda over ``_EXPRESSION_ARGS``, so its
+    names are fast locals rather than lookups in a per-call dict.
+    """
+
+    tree = ast.parse(expression, filename="<expr>", mode="eval")
+    arguments = ast.arguments(
+        posonlyargs=[],
+        args=[ast.arg(arg=name) for name in _EXPRESSION_ARGS],
+        kwonlyargs=[],
+        kw_defaults=[],
+        defaults=[],
+    )
+    function = ast.Expression(body=ast.Lambda(args=arguments, body=tree.body))
+    ast.fix_missing_locations(function)
+    return eval(compile(function, "<expr>", "eval"), _EXPRESSION_GLOBALS)  # noqa: S307
+
+
 @dataclass(slots=True)
 class TimestampGenerator:
     """Generate timestamps in ISO8601 or UNIX seconds format."""
 
     mode: str = "iso"
+    _now: Callable[[], str | int] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._now = _unix_now if self.mode == "unix" else _iso_now
 
     @classmethod
     def from_spec(cls, mode: str) -> TimestampGenerator:
@@ -259,10 +336,19 @@ class TimestampGenerator:
     def next_value(self) -> str | int:
         """Return the current timestamp in the configured format."""
 
-        now = datetime.now(UTC)
-        if self.mode == "unix":
-            return int(now.timestamp())
-        return now.isoformat()
+        return self._now()
+
+
+def _iso_now() -> str:
+    """Return the current UTC time as an ISO8601 string."""
+
+    return datetime.now(UTC).isoformat()
+
+
+def _unix_now() -> int:
+    """Return whole UNIX seconds without building an intermediate datetime."""
+
+    return int(time.time())
 
 
 @dataclass(slots=True)
@@ -272,7 +358,12 @@ class UUIDGenerator:
     def next_value(self) -> str:
         """Return a new UUID string."""
 
-        return str(uuid.uuid4())
+        # Same randomness source as uuid.uuid4(), without building a UUID object.
+        raw = bytearray(os.urandom(16))
+        raw[6] = (raw[6] & 0x0F) | 0x40
+        raw[8] = (raw[8] & 0x3F) | 0x80
+        text = raw.hex()
+        return f"{text[:8]}-{text[8:12]}-{text[12:16]}-{text[16:20]}-{text[20:]}"
 
 
 @dataclass(slots=True)
@@ -306,3 +397,21 @@ class NullGenerator:
         """Return a null-like value."""
 
         return None
+
+
+_GeneratorFactory = Callable[[Any, random.Random], ValueGenerator]
+
+_GENERATOR_FACTORIES: dict[str, _GeneratorFactory] = {
+    "toggle": lambda data, rng: BoolToggleGenerator(value=bool(data)),
+    "walk": lambda data, rng: NumberWalkGenerator.from_spec(data),
+    "random": lambda data, rng: NumberRandomGenerator.from_spec(data, rng=rng),
+    "pick": lambda data, rng: ChoiceGenerator.from_spec(data, rng=rng),
+    "seq": lambda data, rng: SequenceGenerator.from_spec(data),
+    "expr": lambda data, rng: ExpressionGenerator.from_spec(str(data), rng=rng),
+    "time": lambda data, rng: TimestampGenerator.from_spec(str(data)),
+    "uuid": lambda data, rng: UUIDGenerator(),
+    "counter": lambda data, rng: CounterGenerator.from_spec(data),
+    "null": lambda data, rng: NullGenerator(),
+}
+
+GENERATOR_OPERATORS = frozenset(_GENERATOR_FACTORIES)
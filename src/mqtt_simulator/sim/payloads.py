@@ -6,7 +6,8 @@ import base64
 import copy
 import json
 import random
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -20,8 +21,17 @@ from ..config.models import (
     TextPayloadConfig,
 )
 from ..errors import PayloadBuildError
-from .generators import ValueGenerator, build_value_generator
-from .preview import preview_payload
+from .generators import (
+    GENERATOR_OPERATORS,
+    IMMUTABLE_TYPES,
+    ValueGenerator,
+    build_value_generator,
+)
+from .preview import preview_payload, truncate_preview
+
+# One shared compact encoder; ``json.dumps`` with non-default options builds a new
+# ``JSONEncoder`` on every call.
+_JSON_ENCODE = json.JSONEncoder(separators=(",", ":"), default=str).encode
 
 
 @dataclass(slots=True)
@@ -44,12 +54,17 @@ class TextPayloadBuilder:
     """Publish a constant text payload."""
 
     value: str
+    _result: PayloadBuildResult = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._result = PayloadBuildResult(
+            self.value.encode("utf-8"), preview_payload(self.value, "text")
+        )
 
     def build(self) -> PayloadBuildResult:
-        """Encode the text payload as UTF-8."""
+        """Return the text payload, encoded once as UTF-8."""
 
-        payload = self.value.encode("utf-8")
-        return PayloadBuildResult(payload, preview_payload(self.value, "text"))
+        return self._result
 
 
 @dataclass(slots=True)
@@ -57,11 +72,15 @@ class BytesPayloadBuilder:
     """Publish raw bytes from an inline bytes spec."""
 
     payload: bytes
+    _result: PayloadBuildResult = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._result = PayloadBuildResult(self.payload, preview_payload(self.payload, "bytes"))
 
     def build(self) -> PayloadBuildResult:
         """Return the configured raw bytes payload."""
 
-        return PayloadBuildResult(self.payload, preview_payload(self.payload, "bytes"))
+        return self._result
 
 
 @dataclass(slots=True)
@@ -70,13 +89,15 @@ class FilePayloadBuilder:
 
     payload: bytes
     kind: str = "file"
+    _result: PayloadBuildResult = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._result = PayloadBuildResult(self.payload, preview_payload(self.payload, self.kind))
 
     def build(self) -> PayloadBuildResult:
         """Return cached file bytes."""
 
-        return PayloadBuildResult(
-            self.payload, preview_payload(self.payload, self.kind)
-        )
+        return self._result
 
 
 @dataclass(slots=True)
@@ -87,25 +108,36 @@ class SequencePayloadBuilder:
     loop: bool
     encoding: str
     index: int = 0
+    _results: tuple[PayloadBuildResult, ...] = field(init=False, repr=False)
+    _size: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Items never change after load, so each one is encoded a single time.
+        self._results = tuple(_encode_sequence_item(item, self.encoding) for item in self.items)
+        self._size = len(self._results)
 
     def build(self) -> PayloadBuildResult:
         """Return the next sequence item encoded to bytes."""
 
-        if self.index >= len(self.items):
+        if self.index >= self._size:
             if self.loop:
                 self.index = 0
             else:
-                self.index = len(self.items) - 1
-        item = self.items[self.index]
+                self.index = self._size - 1
+        result = self._results[self.index]
         self.index += 1
-        if self.encoding == "json":
-            encoded = json.dumps(item, separators=(",", ":"), default=str).encode(
-                "utf-8"
-            )
-        else:
-            encoded = str(item).encode("utf-8")
-        preview_input = item if self.encoding == "json" else str(item)
-        return PayloadBuildResult(encoded, preview_payload(preview_input, "sequence"))
+        return result
+
+
+def _encode_sequence_item(item: Any, encoding: str) -> PayloadBuildResult:
+    """Encode one sequence item as JSON or plain text."""
+
+    if encoding == "json":
+        return PayloadBuildResult(
+            _JSON_ENCODE(item).encode("utf-8"), preview_payload(item, "sequence")
+        )
+    text = str(item)
+    return PayloadBuildResult(text.encode("utf-8"), preview_payload(text, "sequence"))
 
 
 @dataclass(slots=True)
@@ -145,26 +177,84 @@ class JsonObjectNode:
     """A JSON object assembled from nested constant/generator nodes."""
 
     fields: dict[str, JsonNode]
-
+    _template: dict[str, Any] = field(init=False, repr=False)
+    _dynamic: tuple[tuple[str, Callable[[], Any]], ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Prefill scalar constants and bind one value callable per dynamic field."""
+
+        self._template = {}
+        dynamic: list[tuple[str, Callable[[], Any]]] = []
+        for name, node in self.fields.items():
+            if isinstance(node, JsonConstantNode) and isinstance(node.value, IMMUTABLE_TYPES):
+                self._template[name] = node.value
+                continue
+            self._template[name] = None
+            if isinstance(node, JsonGeneratorNode):
+                # Call the generator directly instead of going through the wrapper node.
+                dynamic.append((name, node.generator.next_value))
+            else:
+                dynamic.append((name, node.build_value))
+        self._dynamic = tuple(dynamic)
 
     def build_value(self) -> dict[str, Any]:
         """Return the next concrete JSON object."""
 
-        return {name: node.build_value() for name, node in self.fields.items()}
+        payload = self._template.copy()
+        for name, next_value in self._dynamic:
+            payload[name] = next_value()
+        return payload
 
 
 @dataclass(slots=True)
 class JsonPayloadBuilder:
-    """Publish a JSON object assembled from a nested payload tree."""
+    """Publish a JSON object assembled from a nested payload tree.
+
+    Leading top-level scalar constants are encoded once as a text prefix; each publish
+    only encodes the remaining fields and splices them onto that prefix.
+    """
 
     root: JsonObjectNode
+    _prefix: str = field(init=False, repr=False)
+    _tail: JsonObjectNode = field(init=False, repr=False)
+    _static: PayloadBuildResult | None = field(init=False, repr=False, default=None)
+
+    def __post_init__(self) -> None:
+        """Split the root fields into a pre-encoded static prefix and a dynamic tail."""
+
+        items = list(self.root.fields.items())
+        split = 0
+        while split < len(items):
+            node = items[split][1]
+            if not (isinstance(node, JsonConstantNode) and isinstance(node.value, IMMUTABLE_TYPES)):
+                break
+            split += 1
+        leading = {name: node.build_value() for name, node in items[:split]}
+        # Drop the closing brace so the tail's members can be appended.
+        self._prefix = _JSON_ENCODE(leading)[:-1] if leading else ""
+        self._tail = JsonObjectNode(fields=dict(items[split:]))
+        if _is_static_node(self.root):
+            # No generators anywhere in the tree: every publish would encode the same bytes.
+            self._static = self._encode()
 
     def build(self) -> PayloadBuildResult:
         """Generate a JSON object and encode it as UTF-8 bytes."""
 
-        payload = self.root.build_value()
-        encoded = json.dumps(payload, separators=(",", ":"), default=str).encode("utf-8")
-        return PayloadBuildResult(encoded, preview_payload(payload, "json"))
+        if self._static is not None:
+            return self._static
+        return self._encode()
+
+    def _encode(self) -> PayloadBuildResult:
+        """Encode the next payload by splicing the dynamic tail onto the static prefix."""
+
+        tail = _JSON_ENCODE(self._tail.build_value())
+        if not self._prefix:
+            text = tail
+        elif tail == "{}":
+            text = self._prefix + "}"
+        else:
+            text = f"{self._prefix},{tail[1:]}"
+        return PayloadBuildResult(text.encode("utf-8"), truncate_preview(text))
 
 
 def build_text_builder(payload_spec: TextPayloadConfig) -> TextPayloadBuilder:
@@ -236,28 +326,20 @@ def build_payload_builder(
 ) -> PayloadBuilder:
     """Build the correct payload builder from an inline payload config."""
 
-    kind = payload.kind
-    spec = payload.spec
-
-    if kind == "text":
-        assert isinstance(spec, TextPayloadConfig)
-        return build_text_builder(spec)
-    if kind == "json":
-        assert isinstance(spec, JsonPayloadConfig)
-        return build_json_builder(spec, rng=rng)
-    if kind == "sequence":
-        assert isinstance(spec, SequencePayloadConfig)
-        return build_sequence_builder(spec)
-    if kind == "bytes":
-        assert isinstance(spec, BytesPayloadConfig)
-        return build_bytes_builder(spec)
-    if kind == "file":
-        assert isinstance(spec, FilePayloadConfig)
-        return build_file_builder(spec, config_dir=config_dir, kind="file")
-    if kind == "pickle":
-        assert isinstance(spec, PicklePayloadConfig)
-        return build_file_builder(spec, config_dir=config_dir, kind="pickle")
-    raise PayloadBuildError(f"Unsupported payload kind: {kind}")
+    factory = _PAYLOAD_FACTORIES.get(payload.kind)
+    if factory is None:
+        raise PayloadBuildError(f"Unsupported payload kind: {payload.kind}")
+    return factory(payload.spec, config_dir, rng)
+
+
+def _is_static_node(node: JsonNode) -> bool:
+    """Return whether a compiled JSON node always produces the same value."""
+
+    if isinstance(node, JsonConstantNode):
+        return True
+    if isinstance(node, JsonObjectNode):
+        return all(_is_static_node(child) for child in node.fields.values())
+    return False
 
 
 def _compile_json_object(value: dict[str, Any], *, rng: random.Random) -> JsonObjectNode:
@@ -265,7 +347,7 @@ def _compile_json_object(value: dict[str, Any], *, rng: random.Random) -> JsonOb
 
     return JsonObjectNode(
         fields={
-            key: _compile_json_node(item, rng=random.Random(rng.random()))
+            key: _compile_json_node(item, rng=random.Random(rng.getrandbits(64)))
             for key, item in value.items()
         }
     )
@@ -275,18 +357,23 @@ def _compile_json_node(value: Any, *, rng: random.Random) -> JsonNode:
     """Compile one validated JSON value into a runtime node."""
 
     if isinstance(value, dict):
-        if len(value) == 1 and next(iter(value)) in {
-            "toggle",
-            "pick",
-            "seq",
-            "walk",
-            "random",
-            "expr",
-            "time",
-            "uuid",
-            "counter",
-            "null",
-        }:
+        if len(value) == 1 and next(iter(value)) in GENERATOR_OPERATORS:
             return JsonGeneratorNode(generator=build_value_generator(value, rng=rng))
         return _compile_json_object(value, rng=rng)
     return JsonConstantNode(value=value)
+
+
+_PayloadFactory = Callable[[Any, Path, random.Random], PayloadBuilder]
+
+_PAYLOAD_FACTORIES: dict[str, _PayloadFactory] = {
+    "text": lambda spec, config_dir, rng: build_text_builder(spec),
+    "json": lambda spec, config_dir, rng: build_json_builder(spec, rng=rng),
+    "sequence": lambda spec, config_dir, rng: build_sequence_builder(spec),
+    "bytes": lambda spec, config_dir, rng: build_bytes_builder(spec),
+    "file": lambda spec, config_dir, rng: build_file_builder(
+        spec, config_dir=config_dir, kind="file"
+    ),
+    "pickle": lambda spec, config_dir, rng: build_file_builder(
+        spec, config_dir=config_dir, kind="pickle"
+    ),
+}
@@ -0,0 +1,23 @@
+"""Deterministic seed derivation for stream and lifecycle RNGs."""
+
+from __future__ import annotations
+
+import hashlib
+
+
+def stable_seed(key: str) -> int:
+    """Return a 48-bit seed derived from ``key`` that is identical across runs.
+
+    Unlike ``hash()``, the result does not depend on ``PYTHONHASHSEED``.
+    """
+
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=6).digest()
+    return int.from_bytes(digest, "little")
+
+
+def derive_seed(base_seed: int | None, key: str) -> int | None:
+    """Combine a base seed with a stream or session key, or return ``None`` if unseeded."""
+
+    if base_seed is None:
+        return None
+    return stable_seed(f"{base_seed}:{key}")
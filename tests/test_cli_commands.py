@@ -75,7 +75,7 @@ def test_run_command_uses_fake_adapter_and_log_mode(monkeypatch) -> None:
         created_adapters.append(adapter)
         return adapter
 
-    monkeypatch.setattr("mqtt_simulator.cli.PahoBrokerAdapter", fake_paho_adapter)
+    monkeypatch.setattr("mqtt_simulator.mqtt.paho_adapter.PahoBrokerAdapter", fake_paho_adapter)
 
     with runner.isolated_filesystem():
         config_path = Path("config.toml")
@@ -93,5 +93,5 @@ def test_run_command_uses_fake_adapter_and_log_mode(monkeypatch) -> None:
     assert "Starting simulator:" in result.stdout
     assert "Finished (" in result.stdout
     assert created_adapters
-    assert any(adapter.published for adapter in created_adapters)
+    assert any(adapter.topics for adapter in created_adapters)
     assert log_exists
@@ -44,7 +44,8 @@ temp = { random = { type = "int", min = 20, max = 22 } }
     assert summary.client_session_count == 3
     assert summary.stream_template_count == 1
     assert summary.resolved_stream_count == 3
-    assert "payload_kinds=[json]" in text
+    assert summary.payload_kinds == ["json"]
+    assert text.endswith("payload_kinds=[json]")
 
 
 def test_load_config_raises_on_missing_file(tmp_path: Path) -> None:
@@ -104,3 +105,106 @@ value = "hello-${name}"
     assert [item.topic for item in resolved] == ["site/a", "site/b"]
     assert [item.payload.kind for item in resolved] == ["text", "text"]
     assert [item.payload.spec.value for item in resolved] == ["hello-a", "hello-b"]
+
+
+def test_load_config_rejects_invalid_expression_syntax(tmp_path: Path) -> None:
+    config_path = tmp_path / "bad-expr.toml"
+    config_path.write_text(
+        """
+config_version = 1
+
+[brokers.main]
+host = "localhost"
+
+[clients.main]
+broker = "main"
+id = "sim-1"
+
+[[streams]]
+client = "main"
+topic = "sensor/value"
+every = "1s"
+
+[streams.payload.json]
+value = { expr = "prev +" }
+""".strip(),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ConfigValidationError) as exc_info:
+        load_config(config_path)
+
+    assert "expr is not a valid expression" in str(exc_info.value)
+
+
+def test_templated_expressions_are_checked_after_expansion(tmp_path: Path) -> None:
+    config_path = tmp_path / "templated-expr.toml"
+    template = """
+config_version = 1
+
+[brokers.main]
+host = "localhost"
+
+[clients.main]
+broker = "main"
+id = "sim-1"
+
+[[streams]]
+client = "main"
+topic = "sensor/${{dev}}"
+every = "1s"
+
+[streams.expand]
+dev = {dev}
+
+[streams.payload.json]
+value = {{ expr = "count * ${{dev}}" }}
+""".strip()
+    config_path.write_text(template.format(dev="{ range = [1, 2] }"), encoding="utf-8")
+
+    resolved = resolve_streams(load_config(config_path))
+
+    assert [item.payload.spec.root["value"] for item in resolved] == [
+        {"expr": "count * 1"},
+        {"expr": "count * 2"},
+    ]
+
+    config_path.write_text(template.format(dev='{ list = ["+"] }'), encoding="utf-8")
+
+    with pytest.raises(ConfigValidationError) as exc_info:
+        resolve_streams(load_config(config_path))
+
+    assert "expr is not a valid expression" in str(exc_info.value)
+    [error] = exc_info.value.details["errors"]
+    assert error.startswith("streams[0].payload.json: ")
+
+
+def test_load_config_rejects_max_burst_without_max_rate(tmp_path: Path) -> None:
+    config_path = tmp_path / "burst-only.toml"
+    config_path.write_text(
+        """
+config_version = 1
+
+[brokers.main]
+host = "localhost"
+max_burst = 10
+
+[clients.main]
+broker = "main"
+id = "sim-1"
+
+[[streams]]
+client = "main"
+topic = "sensor/value"
+every = "1s"
+
+[streams.payload]
+text = "hello"
+""".strip(),
+        encoding="utf-8",
+    )
+
+    with pytest.raises(ConfigValidationError) as exc_info:
+        load_config(config_path)
+
+    assert "max_burst requires max_rate" in str(exc_info.value)
@@ -5,20 +5,19 @@ import logging
 from mqtt_simulator.cli_errors import handle_cli_exception
 from mqtt_simulator.errors import ConfigValidationError
 
+_EXPECTED_LOGGER = logging.getLogger("test.errors.expected")
+_UNEXPECTED_LOGGER = logging.getLogger("test.errors.unexpected")
 
-def test_handle_cli_exception_maps_expected_errors() -> None:
-    logger = logging.getLogger("test.errors.expected")
 
-    result = handle_cli_exception(ConfigValidationError("Bad config."), logger)
+def test_handle_cli_exception_maps_expected_errors() -> None:
+    result = handle_cli_exception(ConfigValidationError("Bad config."), _EXPECTED_LOGGER)
 
     assert result.exit_code == 2
     assert result.message == "Bad config."
 
 
 def test_handle_cli_exception_maps_unexpected_errors() -> None:
-    logger = logging.getLogger("test.errors.unexpected")
-
-    result = handle_cli_exception(RuntimeError("boom"), logger)
+    result = handle_cli_exception(RuntimeError("boom"), _UNEXPECTED_LOGGER)
 
     assert result.exit_code == 1
     assert "See log file" in result.message
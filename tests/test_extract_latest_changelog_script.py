@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import importlib.util
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
+@lru_cache(maxsize=1)
 def _load_module():
     script_path = Path(".github/scripts/extract_latest_changelog.py")
     spec = importlib.util.spec_from_file_location("extract_latest_changelog", script_path)
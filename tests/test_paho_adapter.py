@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+import paho.mqtt.client as mqtt
+
+from mqtt_simulator.config.models import BrokerConfig
+from mqtt_simulator.errors import BrokerPublishError
+from mqtt_simulator.mqtt.adapter import PublishRequest, PublishResult
+from mqtt_simulator.mqtt.paho_adapter import PahoBrokerAdapter
+from mqtt_simulator.runtime.models import RuntimeClient
+
+
+class StubMessageInfo:
+    """Stand-in for ``mqtt.MQTTMessageInfo`` with a scripted outcome."""
+
+    def __init__(self, mid: int, *, rc: int, wait_error: str | None) -> None:
+        self.mid = mid
+        self.rc = rc
+        self._wait_error = wait_error
+
+    def wait_for_publish(self, timeout: float | None = None) -> None:
+        if self._wait_error is not None:
+            raise RuntimeError(self._wait_error)
+
+
+class StubPahoClient:
+    """Records publishes and answers them according to the topic name."""
+
+    def __init__(self) -> None:
+        self.published: list[str] = []
+
+    def publish(self, topic: str, payload: bytes, qos: int, retain: bool) -> StubMessageInfo:
+        self.published.append(topic)
+        mid = len(self.published)
+        if topic == "rejected":
+            return StubMessageInfo(mid, rc=mqtt.MQTT_ERR_NO_CONN, wait_error=None)
+        return StubMessageInfo(
+            mid,
+            rc=mqtt.MQTT_ERR_SUCCESS,
+            wait_error="connection lost" if topic == "dropped" else None,
+        )
+
+
+def _adapter(client: StubPahoClient) -> PahoBrokerAdapter:
+    broker = BrokerConfig(name="main", host="localhost")
+    adapter = PahoBrokerAdapter(
+        RuntimeClient(
+            session_id="session-1",
+            client_name="main",
+            broker_name="main",
+            broker=broker,
+            client_id="demo-client",
+            clean_session=True,
+            lifecycle={},
+        ),
+        logger=logging.getLogger("test.paho"),
+    )
+    adapter._client = client
+    return adapter
+
+
+def test_paho_publish_many_reports_each_failure_in_place() -> None:
+    client = StubPahoClient()
+    adapter = _adapter(client)
+
+    results = asyncio.run(
+        adapter.publish_many(
+            [
+                PublishRequest("sent/qos0", b"0"),
+                PublishRequest("dropped", b"1", qos=1),
+                PublishRequest("rejected", b"2", qos=1),
+                PublishRequest("sent/qos2", b"3", qos=2),
+                PublishRequest("sent/qos1", b"4", qos=1),
+            ]
+        )
+    )
+
+    assert client.published == ["sent/qos0", "dropped", "rejected", "sent/qos2", "sent/qos1"]
+    assert results[0] == PublishResult(message_id=1)
+    assert isinstance(results[1], BrokerPublishError)
+    assert "connection lost" in str(results[1])
+    assert isinstance(results[2], BrokerPublishError)
+    assert results[3] == PublishResult(message_id=4)
+    assert results[4] == PublishResult(message_id=5)
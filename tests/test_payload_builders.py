@@ -1,12 +1,20 @@
 from __future__ import annotations
 
 import base64
+import json
 import pickle
+import uuid
 from pathlib import Path
 
 from mqtt_simulator.config.expand import ResolvedStreamConfig
 from mqtt_simulator.config.models import PayloadConfig
 from mqtt_simulator.sim.registry import build_payload_builder
+from mqtt_simulator.sim.seeding import derive_seed
+
+_RAW_BYTES = b"\x00\x01demo"
+_RAW_B64 = base64.b64encode(_RAW_BYTES).decode("ascii")
+# pickle.dumps({"x": 1}, protocol=4), embedded so the fixture is fixed bytes.
+_PICKLE_BYTES = b"\x80\x04\x95\n\x00\x00\x00\x00\x00\x00\x00}\x94\x8c\x01x\x94K\x01s."
 
 
 def _resolved_stream(payload: dict[str, object], *, stream_id: str = "s1") -> ResolvedStreamConfig:
@@ -43,18 +51,15 @@ def test_text_payload_builder_encodes_utf8(tmp_path: Path) -> None:
 
 
 def test_bytes_payload_builder_supports_base64(tmp_path: Path) -> None:
-    raw = b"\x00\x01demo"
     builder = build_payload_builder(
-        _resolved_stream(
-            {"bytes": {"base64": base64.b64encode(raw).decode("ascii")}}
-        ),
+        _resolved_stream({"bytes": {"base64": _RAW_B64}}),
         config_dir=tmp_path,
         seed=1,
     )
 
     result = builder.build()
 
-    assert result.payload_bytes == raw
+    assert result.payload_bytes == _RAW_BYTES
     assert result.preview.startswith("<bytes ")
 
 
@@ -64,8 +69,7 @@ def test_file_and_pickle_payloads_publish_raw_bytes(tmp_path: Path) -> None:
     file_path = data_dir / "payload.bin"
     pickle_path = data_dir / "payload.pkl"
     file_path.write_bytes(b"abc")
-    pickle_payload = {"x": 1}
-    pickle_path.write_bytes(pickle.dumps(pickle_payload))
+    pickle_path.write_bytes(_PICKLE_BYTES)
 
     file_builder = build_payload_builder(
         _resolved_stream({"file": {"path": str(Path("data") / "payload.bin")}}),
@@ -82,7 +86,8 @@ def test_file_and_pickle_payloads_publish_raw_bytes(tmp_path: Path) -> None:
     pickle_result = pickle_builder.build()
 
     assert file_result.payload_bytes == b"abc"
-    assert pickle_result.payload_bytes == pickle.dumps(pickle_payload)
+    assert pickle_result.payload_bytes == _PICKLE_BYTES
+    assert pickle.loads(pickle_result.payload_bytes) == {"x": 1}
     assert pickle_result.preview.startswith("<pickle ")
 
 
@@ -112,3 +117,51 @@ def test_json_payload_builder_is_seeded_per_stream(tmp_path: Path) -> None:
 
     assert first_a.payload_bytes == first_b.payload_bytes
     assert first_a.preview.startswith("{")
+
+
+def test_json_payload_builder_keeps_field_order_around_static_prefix(tmp_path: Path) -> None:
+    builder = build_payload_builder(
+        _resolved_stream(
+            {
+                "json": {
+                    "site": "plant-a",
+                    "line": 3,
+                    "count": {"counter": {"start": 1, "step": 1}},
+                    "unit": "C",
+                }
+            }
+        ),
+        config_dir=tmp_path,
+        seed=1,
+    )
+
+    first = builder.build()
+    second = builder.build()
+
+    assert first.payload_bytes == b'{"site":"plant-a","line":3,"count":1,"unit":"C"}'
+    assert second.payload_bytes == b'{"site":"plant-a","line":3,"count":2,"unit":"C"}'
+    assert first.preview == '{"site":"plant-a","line":3,"count":1,"unit":"C"}'
+
+
+def test_json_uuid_generator_emits_version4_uuids(tmp_path: Path) -> None:
+    builder = build_payload_builder(
+        _resolved_stream({"json": {"id": {"uuid": True}}}),
+        config_dir=tmp_path,
+        seed=None,
+    )
+
+    first = json.loads(builder.build().payload_bytes)["id"]
+    second = json.loads(builder.build().payload_bytes)["id"]
+
+    parsed = uuid.UUID(first)
+    assert str(parsed) == first
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+    assert first != second
+
+
+def test_derived_seeds_do_not_depend_on_the_python_hash_seed() -> None:
+    # Pinned values: builtin hash() of a str changes with PYTHONHASHSEED, these must not.
+    assert derive_seed(5, "0:temp") == 83898686729575
+    assert derive_seed(6, "0:temp") == 20240349488331
+    assert derive_seed(None, "0:temp") is None
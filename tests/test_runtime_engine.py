@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import logging
+from dataclasses import replace
 
 from mqtt_simulator.config.models import BrokerConfig
+from mqtt_simulator.errors import BrokerPublishError
+from mqtt_simulator.mqtt.adapter import PublishRequest
 from mqtt_simulator.mqtt.fake_adapter import FakeBrokerAdapter
-from mqtt_simulator.runtime.engine import SimulationEngine
+from mqtt_simulator.render.log import LogRenderer
+from mqtt_simulator.runtime.engine import SimulationEngine, _TokenBucket
 from mqtt_simulator.runtime.models import (
     RuntimeClient,
     RuntimeLifecycleMessage,
@@ -13,6 +18,7 @@ from mqtt_simulator.runtime.models import (
     RuntimeSchedule,
     RuntimeSnapshot,
     RuntimeStream,
+    StreamStatus,
 )
 from mqtt_simulator.sim.payloads import TextPayloadBuilder
 
@@ -20,6 +26,8 @@ from mqtt_simulator.sim.payloads import TextPayloadBuilder
 class CollectingRenderer:
     """Minimal renderer used to inspect engine snapshots in tests."""
 
+    coalesce_updates = True
+
     def __init__(self) -> None:
         self.started = False
         self.finished = False
@@ -42,6 +50,23 @@ class CollectingRenderer:
         return None
 
 
+class FakeClock:
+    """Virtual clock whose sleeps advance time instantly."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return 1_700_000_000.0 + self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
 def _runtime_client() -> RuntimeClient:
     broker = BrokerConfig(name="main", host="localhost")
     return RuntimeClient(
@@ -86,13 +111,14 @@ def test_engine_keep_going_continues_after_stream_error() -> None:
         logger=logging.getLogger("test.engine.keep_going"),
         fail_fast=False,
         duration=0.05,
+        clock=FakeClock(),
     )
 
     result = asyncio.run(engine.run())
 
     assert result.exit_code == 0
     assert result.total_errors >= 1
-    assert any(item[0] == "ok/topic" for item in adapter.published)
+    assert "ok/topic" in adapter.topics
     assert renderer.started and renderer.finished
 
 
@@ -107,6 +133,7 @@ def test_engine_fail_fast_returns_nonzero() -> None:
         logger=logging.getLogger("test.engine.fail_fast"),
         fail_fast=True,
         duration=0.05,
+        clock=FakeClock(),
     )
 
     result = asyncio.run(engine.run())
@@ -116,6 +143,37 @@ def test_engine_fail_fast_returns_nonzero() -> None:
     assert result.total_errors >= 1
 
 
+class FailingPayloadBuilder:
+    """Payload builder whose every build raises."""
+
+    def build(self):
+        raise ValueError("boom")
+
+
+def test_engine_fail_fast_still_publishes_messages_built_before_the_failure() -> None:
+    adapter = FakeBrokerAdapter()
+    renderer = CollectingRenderer()
+    failing_stream = replace(
+        _runtime_stream("broken/topic", "x"), payload_builder=FailingPayloadBuilder()
+    )
+    engine = SimulationEngine(
+        clients={"session-1": _runtime_client()},
+        streams=[_runtime_stream("ok/topic", "1"), failing_stream],
+        adapter_factory=lambda _client: adapter,
+        renderer=renderer,
+        logger=logging.getLogger("test.engine.fail_fast_build"),
+        fail_fast=True,
+        duration=0.05,
+        clock=FakeClock(),
+    )
+
+    result = asyncio.run(engine.run())
+
+    assert result.failed_fast is True
+    assert result.total_publishes == 1
+    assert adapter.topics == ["ok/topic"]
+
+
 def test_engine_publishes_online_and_offline_lifecycle_messages() -> None:
     adapter = FakeBrokerAdapter()
     renderer = CollectingRenderer()
@@ -145,9 +203,152 @@ def test_engine_publishes_online_and_offline_lifecycle_messages() -> None:
         renderer=renderer,
         logger=logging.getLogger("test.engine.lifecycle"),
         duration=0.01,
+        clock=FakeClock(),
     )
 
     result = asyncio.run(engine.run())
 
     assert result.exit_code == 0
-    assert [topic for topic, *_ in adapter.published] == ["demo/online", "demo/offline"]
+    assert adapter.topics == ["demo/online", "demo/offline"]
+
+
+def test_engine_publishes_due_streams_as_one_batch() -> None:
+    adapter = FakeBrokerAdapter()
+    renderer = CollectingRenderer()
+    engine = SimulationEngine(
+        clients={"session-1": _runtime_client()},
+        streams=[_runtime_stream(f"batch/{index}", str(index), every=1.0) for index in range(3)],
+        adapter_factory=lambda _client: adapter,
+        renderer=renderer,
+        logger=logging.getLogger("test.engine.batch"),
+        duration=0.05,
+        clock=FakeClock(),
+    )
+
+    result = asyncio.run(engine.run())
+
+    assert result.total_publishes == 3
+    assert adapter.topics == ["batch/0", "batch/1", "batch/2"]
+    # Initial render, one update for the whole batch, and the final frame.
+    assert [snapshot.total_publishes for snapshot in renderer.snapshots] == [0, 3, 3]
+
+
+def test_fake_adapter_publish_many_returns_errors_in_place() -> None:
+    adapter = FakeBrokerAdapter(fail_topics={"bad/topic"})
+
+    async def scenario():
+        await adapter.connect()
+        return await adapter.publish_many(
+            [
+                PublishRequest("ok/1", b"1"),
+                PublishRequest("bad/topic", b"2"),
+                PublishRequest("ok/2", b"3", qos=1),
+            ]
+        )
+
+    results = asyncio.run(scenario())
+
+    assert isinstance(results[1], BrokerPublishError)
+    assert adapter.topics == ["ok/1", "ok/2"]
+
+
+def test_engine_coalesces_renderer_updates() -> None:
+    adapter = FakeBrokerAdapter()
+    renderer = CollectingRenderer()
+    engine = SimulationEngine(
+        clients={"session-1": _runtime_client()},
+        streams=[_runtime_stream("fast/topic", "x", every=0.001)],
+        adapter_factory=lambda _client: adapter,
+        renderer=renderer,
+        logger=logging.getLogger("test.engine.coalesce"),
+        duration=0.2,
+        clock=FakeClock(),
+        render_interval=0.05,
+    )
+
+    result = asyncio.run(engine.run())
+
+    assert result.total_publishes > 20
+    assert len(renderer.snapshots) <= 12
+    assert renderer.snapshots[-1].total_publishes == result.total_publishes
+
+
+def test_engine_sends_every_batch_to_log_renderer() -> None:
+    adapter = FakeBrokerAdapter()
+    output = io.StringIO()
+    engine = SimulationEngine(
+        clients={"session-1": _runtime_client()},
+        streams=[_runtime_stream("fast/topic", "x", every=0.001)],
+        adapter_factory=lambda _client: adapter,
+        renderer=LogRenderer(stream=output, verbose=True),
+        logger=logging.getLogger("test.engine.log_renderer"),
+        duration=0.2,
+        clock=FakeClock(),
+        render_interval=0.05,
+    )
+
+    result = asyncio.run(engine.run())
+
+    pub_lines = [line for line in output.getvalue().splitlines() if line.startswith("PUB ")]
+    assert result.total_publishes > 20
+    assert len(pub_lines) == result.total_publishes
+
+
+def test_token_bucket_hands_out_one_slot_per_waiting_caller() -> None:
+    bucket = _TokenBucket.create(2.0, burst=2, now=0.0)
+
+    assert [bucket.reserve(0.0) for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    # By t=1.0 both waits are covered; the refill never exceeds the burst size.
+    assert bucket.reserve(1.0) == 0.5
+    assert bucket.reserve(10.0) == 0.0
+    assert bucket.tokens == 1.0
+
+
+def test_rate_limited_broker_does_not_stall_other_brokers() -> None:
+    throttled = replace(
+        _runtime_client(),
+        session_id="session-throttled",
+        broker=BrokerConfig(name="cloud", host="cloud", max_rate=10, max_burst=1),
+    )
+    adapters = {"session-1": FakeBrokerAdapter(), "session-throttled": FakeBrokerAdapter()}
+    engine = SimulationEngine(
+        clients={"session-1": _runtime_client(), "session-throttled": throttled},
+        streams=[
+            _runtime_stream("free/topic", "x", every=0.01),
+            replace(
+                _runtime_stream("throttled/topic", "y", every=0.001),
+                client_session_id="session-throttled",
+            ),
+        ],
+        adapter_factory=lambda client: adapters[client.session_id],
+        renderer=CollectingRenderer(),
+        logger=logging.getLogger("test.engine.rate_limit"),
+        duration=1.0,
+        clock=FakeClock(),
+    )
+
+    asyncio.run(engine.run())
+
+    # One burst token plus ten per second on the limited broker.
+    assert 10 <= len(adapters["session-throttled"].topics) <= 11
+    assert len(adapters["session-1"].topics) >= 95
+
+
+def test_stream_status_snapshot_copies_every_field() -> None:
+    status = StreamStatus(
+        stream_id="s1",
+        topic="t/1",
+        schedule_label="fixed 1s",
+        state="running",
+        publish_count=3,
+        last_publish_ts=12.5,
+        last_payload_preview="hi",
+        last_error="boom",
+        error_count=1,
+    )
+
+    copy = status.snapshot()
+    status.publish_count += 1
+
+    assert copy is not status
+    assert copy == replace(status, publish_count=3)